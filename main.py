@@ -3,10 +3,16 @@ Main entry point for the Simple Tetris game.
 """
 import pygame
 import sys
-from src.game_engine import GameEngine
+from src.game_engine import GameEngine, InputState
 from src.game_display import GameDisplay
 
 
+RENDER_FPS = 60         # Frame rate cap while playing
+IDLE_FPS = 10           # Frame rate cap on the game over screen
+LOGIC_DT = 1.0 / 120.0  # Fixed game logic step in seconds
+MAX_FRAME_TIME = 0.25   # Upper bound on logic time simulated per frame
+
+
 def main():
     """
     Main game loop.
@@ -15,58 +21,51 @@ def main():
     game_engine = GameEngine()
     game_display = GameDisplay()
     
+    # Have SDL drop every event type we don't handle before it is queued
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.VIDEOEXPOSE, pygame.KEYDOWN])
+    
     # Game loop variables
     clock = pygame.time.Clock()
     running = True
-    
-    # Input tracking for continuous movement
-    keys_held = {
-        'left': False,
-        'right': False,
-        'down': False,
-        'up': False
-    }
+    logic_accum = 0.0
     
     try:
         while running:
-            dt = clock.tick(60) / 1000.0  # Delta time in seconds
+            # Delta time in seconds; sleep longer while nothing is moving
+            fps = IDLE_FPS if game_engine.game_over else RENDER_FPS
+            dt = clock.tick(fps) / 1000.0
             
-            # Handle events
+            # Handle events (only the allowed types ever reach the queue)
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
-                
-                elif event.type == pygame.KEYDOWN:
-                    # Handle key press events - only set flags, don't move immediately
-                    if event.key == pygame.K_LEFT:
-                        keys_held['left'] = True
-                    elif event.key == pygame.K_RIGHT:
-                        keys_held['right'] = True
-                    elif event.key == pygame.K_DOWN:
-                        keys_held['down'] = True
-                    elif event.key == pygame.K_UP:
-                        keys_held['up'] = True
-                    elif event.key == pygame.K_r and game_engine.game_over:
-                        # Restart game
-                        game_engine = GameEngine()
-                
-                elif event.type == pygame.KEYUP:
-                    if event.key == pygame.K_LEFT:
-                        keys_held['left'] = False
-                    elif event.key == pygame.K_RIGHT:
-                        keys_held['right'] = False
-                    elif event.key == pygame.K_DOWN:
-                        keys_held['down'] = False
-                    elif event.key == pygame.K_UP:
-                        keys_held['up'] = False
+                elif event.type == pygame.VIDEOEXPOSE:
+                    # Window contents were lost, repaint even if nothing changed
+                    game_engine.dirty = True
+                    game_display.invalidate()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_r and game_engine.game_over:
+                    # Restart game
+                    game_engine = GameEngine()
+            
+            # Held keys come straight from SDL's state, polled once per frame
+            pressed = pygame.key.get_pressed()
+            keys = InputState(pressed[pygame.K_LEFT],
+                              pressed[pygame.K_RIGHT],
+                              pressed[pygame.K_DOWN],
+                              pressed[pygame.K_UP])
             
-            # Update game logic
-            game_engine.update(dt)
+            # Update game logic and continuous input in fixed steps
+            logic_accum += min(dt, MAX_FRAME_TIME)
+            while logic_accum >= LOGIC_DT:
+                game_engine.update(LOGIC_DT)
+                game_engine.handle_input(keys)
+                logic_accum -= LOGIC_DT
             
-            # Handle continuous input (for held keys)
-            game_engine.handle_input(keys_held)
+            # Render only when the game state has changed
+            if not game_engine.dirty:
+                continue
             
-            # Render
             game_display.clear_screen()
             game_display.draw_board(game_engine.board)
             game_display.draw_piece(game_engine.current_piece)
@@ -79,6 +78,7 @@ def main():
                 game_display.draw_game_over()
             
             game_display.update_display()
+            game_engine.dirty = False
     
     finally:
         game_display.quit()
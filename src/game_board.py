@@ -1,12 +1,57 @@
 """
 Game Board class for managing the Tetris playing field.
 """
-from typing import List, Optional, TYPE_CHECKING
+from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from .tetromino import SHAPE_NAMES, SHAPE_ROW_MASKS
 
 if TYPE_CHECKING:
     from tetromino import Tetromino
 
 
+# fits(row_masks, x, y, width, height) -> True if the shape fits at (x, y)
+FitsFunc = Callable[[List[int], int, int, int, int], bool]
+
+
+def _build_fits_func(shape_id: int, rotation: int) -> FitsFunc:
+    """
+    Generate a fit test specialized for one shape rotation.
+    
+    The extents and row masks are baked into the generated source as
+    constants, so the test is a single unrolled boolean expression.
+    
+    Args:
+        shape_id: Tetromino shape id
+        rotation: Rotation index of the shape
+        
+    Returns:
+        Function taking (row_masks, x, y, width, height)
+    """
+    min_row, max_row, min_col, max_col, piece_rows = SHAPE_ROW_MASKS[shape_id][rotation]
+    
+    # Boundary checks against the piece extents
+    terms = [f"x >= {-min_col}", f"x < width - {max_col}",
+             f"y >= {-min_row}", f"y < height - {max_row}"]
+    
+    # One AND per piece row against the board row masks
+    for i, piece_row in enumerate(piece_rows):
+        terms.append(f"not row_masks[y + {min_row + i}] & ({piece_row} << (x + {min_col}))")
+    
+    name = f"_fits_{SHAPE_NAMES[shape_id]}_{rotation}"
+    source = (f"def {name}(row_masks, x, y, width, height):\n"
+              f"    return {' and '.join(terms)}\n")
+    namespace: Dict[str, FitsFunc] = {}
+    exec(source, namespace)
+    return namespace[name]
+
+
+# Specialized fit tests for every rotation of every shape, indexed by shape id
+FITS_FUNCS: Tuple[Tuple[FitsFunc, ...], ...] = tuple(
+    tuple(_build_fits_func(shape_id, rotation) for rotation in range(len(rotations)))
+    for shape_id, rotations in enumerate(SHAPE_ROW_MASKS)
+)
+
+
 class GameBoard:
     """
     Represents the Tetris game board (10x20 grid).
@@ -22,7 +67,9 @@ class GameBoard:
         """
         self.width: int = width
         self.height: int = height
-        self.grid: List[List[int]] = [[0 for _ in range(width)] for _ in range(height)]
+        # Each row is a bitmask: bit x is set when column x is occupied
+        self.row_masks: List[int] = [0] * height
+        self.full_mask: int = (1 << width) - 1
     
     def is_valid_position(self, piece: 'Tetromino', x: int, y: int) -> bool:
         """
@@ -36,55 +83,38 @@ class GameBoard:
         Returns:
             True if the position is valid, False otherwise
         """
-        # Temporarily move piece to check position
-        original_x, original_y = piece.x, piece.y
-        piece.x, piece.y = x, y
-        
-        try:
-            blocks = piece.get_blocks()
-            
-            for block_x, block_y in blocks:
-                # Check boundaries
-                if not self._is_within_boundaries(block_x, block_y):
-                    return False
-                
-                # Check collision with existing blocks
-                if self._has_block_collision(block_x, block_y):
-                    return False
-            
-            return True
-        finally:
-            # Restore original position
-            piece.x, piece.y = original_x, original_y
+        return self._fits(piece.shape_id, piece.rotation, x, y)
     
-    def _is_within_boundaries(self, x: int, y: int) -> bool:
+    def _fits(self, shape_id: int, rotation: int, x: int, y: int) -> bool:
         """
-        Check if the given coordinates are within the board boundaries.
+        Check if a shape in the given rotation fits at the specified position.
+        
+        Works on the precomputed shape tables only, so no piece is mutated.
         
         Args:
-            x: X coordinate to check
-            y: Y coordinate to check
+            shape_id: Tetromino shape id
+            rotation: Rotation index of the shape
+            x: X position to check
+            y: Y position to check
             
         Returns:
-            True if within boundaries, False otherwise
+            True if the position is valid, False otherwise
         """
-        return 0 <= x < self.width and 0 <= y < self.height
+        return FITS_FUNCS[shape_id][rotation](self.row_masks, x, y,
+                                                self.width, self.height)
     
-    def _has_block_collision(self, x: int, y: int) -> bool:
+    def _is_within_boundaries(self, x: int, y: int) -> bool:
         """
-        Check if there's a collision with an existing block at the given position.
+        Check if the given coordinates are within the board boundaries.
         
         Args:
             x: X coordinate to check
             y: Y coordinate to check
             
         Returns:
-            True if there's a collision, False otherwise
+            True if within boundaries, False otherwise
         """
-        if not self._is_within_boundaries(x, y):
-            return True  # Out of bounds is considered a collision
-        
-        return self.grid[y][x] != 0
+        return 0 <= x < self.width and 0 <= y < self.height
     
     def can_move_piece(self, piece: 'Tetromino', dx: int, dy: int) -> bool:
         """
@@ -112,20 +142,11 @@ class GameBoard:
         Returns:
             True if rotation is valid, False otherwise
         """
-        # Save current rotation
-        original_rotation = piece.rotation
+        # Single-rotation shapes (O) look the same after rotating
+        if piece.rotation_count == 1:
+            return True
         
-        try:
-            # Try rotation
-            max_rotations = len(piece.shape)
-            test_rotation = (piece.rotation + 1) % max_rotations
-            piece.rotation = test_rotation
-            
-            # Check if rotated position is valid
-            return self.is_valid_position(piece, piece.x, piece.y)
-        finally:
-            # Restore original rotation
-            piece.rotation = original_rotation
+        return self._fits(piece.shape_id, piece.next_rotation, piece.x, piece.y)
     
     def place_piece(self, piece: 'Tetromino', x: int, y: int) -> None:
         """
@@ -136,20 +157,16 @@ class GameBoard:
             x: X position to place the piece
             y: Y position to place the piece
         """
-        # Temporarily move piece to placement position
-        original_x, original_y = piece.x, piece.y
-        piece.x, piece.y = x, y
+        min_row, _, min_col, _, piece_rows = SHAPE_ROW_MASKS[piece.shape_id][piece.rotation]
+        left = x + min_col
+        top = y + min_row
         
-        try:
-            blocks = piece.get_blocks()
-            
-            for block_x, block_y in blocks:
-                if 0 <= block_x < self.width and 0 <= block_y < self.height:
-                    # Use a non-zero value to represent occupied cells
-                    self.grid[block_y][block_x] = 1
-        finally:
-            # Restore original position
-            piece.x, piece.y = original_x, original_y
+        # OR each piece row into its board row, dropping blocks off the board
+        for i, piece_row in enumerate(piece_rows):
+            row = top + i
+            if 0 <= row < self.height:
+                bits = piece_row << left if left >= 0 else piece_row >> -left
+                self.row_masks[row] |= bits & self.full_mask
     
     def clear_lines(self) -> int:
         """
@@ -158,19 +175,12 @@ class GameBoard:
         Returns:
             Number of lines cleared
         """
-        lines_cleared = 0
-        row = self.height - 1
-        
-        while row >= 0:
-            if self.is_line_full(row):
-                # Remove the full line
-                del self.grid[row]
-                # Add a new empty line at the top
-                self.grid.insert(0, [0 for _ in range(self.width)])
-                lines_cleared += 1
-                # Don't decrement row since we removed a line
-            else:
-                row -= 1
+        # Keep the incomplete rows and pad the top with empty ones
+        full_mask = self.full_mask
+        kept = [mask for mask in self.row_masks if mask != full_mask]
+        lines_cleared = self.height - len(kept)
+        if lines_cleared:
+            self.row_masks = [0] * lines_cleared + kept
         
         return lines_cleared
     
@@ -187,16 +197,17 @@ class GameBoard:
         if row < 0 or row >= self.height:
             return False
         
-        return all(cell != 0 for cell in self.grid[row])
+        return self.row_masks[row] == self.full_mask
     
     def get_grid_copy(self) -> List[List[int]]:
         """
         Get a copy of the current grid state.
         
         Returns:
-            Deep copy of the grid
+            List of rows, each a list of cell values (1 = occupied, 0 = empty)
         """
-        return [row[:] for row in self.grid]
+        return [[(mask >> col) & 1 for col in range(self.width)]
+                for mask in self.row_masks]
     
     def check_collision_at(self, piece: 'Tetromino', x: int, y: int) -> str:
         """
@@ -211,26 +222,19 @@ class GameBoard:
             'none' if no collision, 'boundary' for boundary collision, 
             'block' for block collision
         """
-        # Temporarily move piece to check position
-        original_x, original_y = piece.x, piece.y
-        piece.x, piece.y = x, y
-        
-        try:
-            blocks = piece.get_blocks()
+        width, height, row_masks = self.width, self.height, self.row_masks
+        for dx, dy in piece.get_offsets():
+            block_x, block_y = x + dx, y + dy
             
-            for block_x, block_y in blocks:
-                # Check boundaries first
-                if not self._is_within_boundaries(block_x, block_y):
-                    return 'boundary'
-                
-                # Check collision with existing blocks
-                if self.grid[block_y][block_x] != 0:
-                    return 'block'
+            # Check boundaries first
+            if block_x < 0 or block_x >= width or block_y < 0 or block_y >= height:
+                return 'boundary'
             
-            return 'none'
-        finally:
-            # Restore original position
-            piece.x, piece.y = original_x, original_y
+            # Check collision with existing blocks
+            if (row_masks[block_y] >> block_x) & 1:
+                return 'block'
+        
+        return 'none'
     
     def is_position_occupied(self, x: int, y: int) -> bool:
         """
@@ -246,4 +250,4 @@ class GameBoard:
         if not self._is_within_boundaries(x, y):
             return False
         
-        return self.grid[y][x] != 0
\ No newline at end of file
+        return (self.row_masks[y] >> x) & 1 != 0
@@ -2,9 +2,9 @@
 Game Display class for rendering the Tetris game using Pygame.
 """
 import pygame
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from .game_board import GameBoard
-from .tetromino import Tetromino
+from .tetromino import Tetromino, SHAPE_NAMES
 
 
 class GameDisplay:
@@ -12,17 +12,25 @@ class GameDisplay:
     Handles all visual rendering for the Tetris game.
     """
     
-    # Color definitions
-    COLORS = {
-        0: (0, 0, 0),        # Empty - Black
-        1: (255, 255, 255),  # Placed blocks - White
+    # Board cell colors, indexed by cell value
+    _CELL_COLORS = (
+        (0, 0, 0),        # Empty - Black
+        (255, 255, 255)   # Placed blocks - White
+    )
+    
+    # Falling/next piece colors, keyed by shape type
+    _PIECE_COLORS = {
         'I': (0, 255, 255),  # Cyan
         'O': (255, 255, 0),  # Yellow
         'T': (128, 0, 128),  # Purple
         'S': (0, 255, 0),    # Green
         'Z': (255, 0, 0),    # Red
         'J': (0, 0, 255),    # Blue
-        'L': (255, 165, 0),  # Orange
+        'L': (255, 165, 0)   # Orange
+    }
+    
+    # UI element colors
+    COLORS = {
         'background': (32, 32, 32),  # Dark gray
         'grid': (64, 64, 64),        # Gray
         'text': (255, 255, 255)      # White
@@ -47,11 +55,117 @@ class GameDisplay:
         self.board_x = (screen_width - 10 * self.block_size) // 2
         self.board_y = (screen_height - 20 * self.block_size) // 2
         
+        # Static empty board and cell rects; draw_board rebuilds them if it
+        # is handed a board of another size
+        self._layout_board(10, 20)
+        
+        # Pre-bordered block surfaces for placed cells and for each shape id
+        # (empty cells are part of the grid background)
+        self._filled_cell_surf = self._build_block_surface(self._CELL_COLORS[1])
+        self._block_surfs = tuple(
+            self._build_block_surface(self._PIECE_COLORS[shape_type]) for shape_type in SHAPE_NAMES
+        )
+        
+        # Piece colors indexed by shape id
+        self._piece_colors_by_id = tuple(self._PIECE_COLORS[shape_type] for shape_type in SHAPE_NAMES)
+        
         # Initialize font
         self.font = pygame.font.Font(None, 36)
         
+        # Pre-render static text
+        self._next_label = self.font.render("Next:", True, self.COLORS['text'])
+        self._game_over_surf = self.font.render("GAME OVER", True, self.COLORS['text'])
+        self._restart_surf = self.font.render("Press R to restart", True, self.COLORS['text'])
+        
+        # (score, lines_cleared, rendered surfaces), re-rendered only on change
+        self._score_cache = (None, None, None)
+        
+        # Next piece preview surfaces keyed by (shape_id, rotation), built on demand
+        self._next_piece_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+        
+        # Semi-transparent game over overlay
+        self._overlay = pygame.Surface((screen_width, screen_height))
+        self._overlay.set_alpha(128)
+        self._overlay.fill((0, 0, 0))
+        
+        # Dirty-rect tracking: what was on screen at the last update
+        self._dirty_rects: List[pygame.Rect] = []
+        self._full_update = True
+        self._last_row_masks: List[int] = []
+        self._last_piece_rects: List[pygame.Rect] = []
+        self._last_next_key: Optional[Tuple[int, int]] = None
+        self._score_rects: List[pygame.Rect] = []
+        self._overlay_drawn = False
+        self._overlay_shown = False
+        
         pygame.display.set_caption("Simple Tetris")
     
+    def _layout_board(self, width: int, height: int) -> None:
+        """
+        Build the grid background and cell rect tables for a board size.
+        
+        Args:
+            width: Board width in blocks
+            height: Board height in blocks
+        """
+        self._grid_size: Tuple[int, int] = (width, height)
+        self._grid_bg = self._build_grid_background(width, height)
+        
+        # Screen rect of every board cell, indexed [row][col], and of every row
+        self._cell_rects = [
+            [pygame.Rect(self.board_x + col * self.block_size, self.board_y + row * self.block_size,
+                         self.block_size, self.block_size)
+             for col in range(width)]
+            for row in range(height)
+        ]
+        self._row_rects = [
+            pygame.Rect(self.board_x, self.board_y + row * self.block_size,
+                        width * self.block_size, self.block_size)
+            for row in range(height)
+        ]
+    
+    def _build_grid_background(self, width: int, height: int) -> pygame.Surface:
+        """
+        Render the empty board with its border and grid lines.
+        
+        Args:
+            width: Board width in blocks
+            height: Board height in blocks
+            
+        Returns:
+            Surface covering the board plus its 2-pixel border
+        """
+        surface = pygame.Surface((width * self.block_size + 4, height * self.block_size + 4))
+        surface.fill(self.COLORS['background'])
+        
+        # Draw board border
+        pygame.draw.rect(surface, self.COLORS['grid'], surface.get_rect(), 2)
+        
+        # Draw empty cells with grid lines
+        for row in range(height):
+            for col in range(width):
+                cell_rect = pygame.Rect(2 + col * self.block_size, 2 + row * self.block_size,
+                                        self.block_size, self.block_size)
+                pygame.draw.rect(surface, self._CELL_COLORS[0], cell_rect)
+                pygame.draw.rect(surface, self.COLORS['grid'], cell_rect, 1)
+        
+        return surface
+    
+    def _build_block_surface(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Render a single board block with its grid-line border.
+        
+        Args:
+            color: Fill color of the block
+            
+        Returns:
+            Surface in the display's pixel format
+        """
+        surface = pygame.Surface((self.block_size, self.block_size))
+        surface.fill(color)
+        pygame.draw.rect(surface, self.COLORS['grid'], surface.get_rect(), 1)
+        return surface.convert()
+    
     def draw_board(self, board: GameBoard) -> None:
         """
         Draw the game board.
@@ -59,27 +173,31 @@ class GameDisplay:
         Args:
             board: The GameBoard to render
         """
-        # Draw board background
-        board_rect = pygame.Rect(self.board_x - 2, self.board_y - 2, 
-                               board.width * self.block_size + 4, 
-                               board.height * self.block_size + 4)
-        pygame.draw.rect(self.screen, self.COLORS['grid'], board_rect, 2)
-        
-        # Draw grid cells
-        for row in range(board.height):
-            for col in range(board.width):
-                x = self.board_x + col * self.block_size
-                y = self.board_y + row * self.block_size
-                
-                cell_value = board.grid[row][col]
-                color = self.COLORS[cell_value]
-                
-                # Draw cell
-                cell_rect = pygame.Rect(x, y, self.block_size, self.block_size)
-                pygame.draw.rect(self.screen, color, cell_rect)
-                
-                # Draw grid lines
-                pygame.draw.rect(self.screen, self.COLORS['grid'], cell_rect, 1)
+        if (board.width, board.height) != self._grid_size:
+            self._layout_board(board.width, board.height)
+            self._full_update = True
+        
+        # Draw the prebuilt empty board
+        self.screen.blit(self._grid_bg, (self.board_x - 2, self.board_y - 2))
+        
+        # Mark rows whose contents changed since the last frame
+        if len(self._last_row_masks) != len(board.row_masks):
+            self._full_update = True
+        else:
+            for row, (old_mask, new_mask) in enumerate(zip(self._last_row_masks, board.row_masks)):
+                if old_mask != new_mask:
+                    self._dirty_rects.append(self._row_rects[row])
+        self._last_row_masks = list(board.row_masks)
+        
+        # Draw only the occupied cells on top, in a single blits() call
+        block_surf = self._filled_cell_surf
+        blit_list = []
+        for row_rects, row_mask in zip(self._cell_rects, board.row_masks):
+            while row_mask:
+                col = (row_mask & -row_mask).bit_length() - 1
+                row_mask &= row_mask - 1
+                blit_list.append((block_surf, row_rects[col]))
+        self.screen.blits(blit_list, doreturn=False)
     
     def draw_piece(self, piece: Tetromino) -> None:
         """
@@ -88,21 +206,23 @@ class GameDisplay:
         Args:
             piece: The Tetromino to render
         """
-        if piece is None:
-            return
-        
-        color = self.COLORS.get(piece.shape_type, self.COLORS[1])
-        blocks = piece.get_blocks()
+        piece_rects = []
+        if piece is not None:
+            block_surf = self._block_surfs[piece.shape_id]
+            cell_rects = self._cell_rects
+            width, height = self._grid_size
+            
+            for block_x, block_y in piece.get_blocks():
+                # Only draw blocks that are within the board area
+                if 0 <= block_x < width and 0 <= block_y < height:
+                    piece_rects.append(cell_rects[block_y][block_x])
+            self.screen.blits([(block_surf, rect) for rect in piece_rects], doreturn=False)
         
-        for block_x, block_y in blocks:
-            # Only draw blocks that are within the board area
-            if 0 <= block_x < 10 and 0 <= block_y < 20:
-                x = self.board_x + block_x * self.block_size
-                y = self.board_y + block_y * self.block_size
-                
-                block_rect = pygame.Rect(x, y, self.block_size, self.block_size)
-                pygame.draw.rect(self.screen, color, block_rect)
-                pygame.draw.rect(self.screen, self.COLORS['grid'], block_rect, 1)
+        # Repaint both the cells the piece left and the ones it now covers
+        if piece_rects != self._last_piece_rects:
+            self._dirty_rects.extend(self._last_piece_rects)
+            self._dirty_rects.extend(piece_rects)
+            self._last_piece_rects = piece_rects
     
     def draw_next_piece(self, piece: Tetromino) -> None:
         """
@@ -115,47 +235,60 @@ class GameDisplay:
             return
         
         # Draw "Next" label
-        next_text = self.font.render("Next:", True, self.COLORS['text'])
         next_x = self.board_x + 12 * self.block_size
         next_y = self.board_y + 2 * self.block_size
-        self.screen.blit(next_text, (next_x, next_y))
+        self.screen.blit(self._next_label, (next_x, next_y))
         
         # Draw next piece
-        color = self.COLORS.get(piece.shape_type, self.COLORS[1])
-        current_shape = piece.get_rotated_shape()
-        
-        preview_x = next_x
-        preview_y = next_y + 40
-        
-        for row_idx, row in enumerate(current_shape):
-            for col_idx, cell in enumerate(row):
-                if cell != '.' and cell != ' ':
-                    x = preview_x + col_idx * (self.block_size // 2)
-                    y = preview_y + row_idx * (self.block_size // 2)
-                    
-                    block_rect = pygame.Rect(x, y, self.block_size // 2, self.block_size // 2)
-                    pygame.draw.rect(self.screen, color, block_rect)
-                    pygame.draw.rect(self.screen, self.COLORS['grid'], block_rect, 1)
+        key = (piece.shape_id, piece.rotation)
+        preview = self._next_piece_cache.get(key)
+        if preview is None:
+            preview = self._build_preview_surface(piece)
+            self._next_piece_cache[key] = preview
+        preview_rect = self.screen.blit(preview, (next_x, next_y + 40))
+        
+        # Every preview surface has the same size, so one rect covers old and new
+        if key != self._last_next_key:
+            self._dirty_rects.append(preview_rect)
+            self._last_next_key = key
+    
+    def _build_preview_surface(self, piece: Tetromino) -> pygame.Surface:
+        """
+        Render a half-size preview of a piece in its current rotation.
+        
+        Args:
+            piece: The Tetromino to render
+            
+        Returns:
+            Transparent surface with the piece blocks drawn on it
+        """
+        preview_block = self.block_size // 2
+        surface = pygame.Surface((4 * preview_block, 4 * preview_block), pygame.SRCALPHA)
+        color = self._piece_colors_by_id[piece.shape_id]
+        
+        for col_idx, row_idx in piece.get_offsets():
+            block_rect = pygame.Rect(col_idx * preview_block, row_idx * preview_block,
+                                     preview_block, preview_block)
+            pygame.draw.rect(surface, color, block_rect)
+            pygame.draw.rect(surface, self.COLORS['grid'], block_rect, 1)
+        
+        return surface
     
     def draw_game_over(self) -> None:
         """
         Draw the game over screen.
         """
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        # Draw semi-transparent overlay
+        self.screen.blit(self._overlay, (0, 0))
+        self._overlay_drawn = True
         
         # Draw game over text
-        game_over_text = self.font.render("GAME OVER", True, self.COLORS['text'])
-        text_rect = game_over_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-        self.screen.blit(game_over_text, text_rect)
+        text_rect = self._game_over_surf.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
+        self.screen.blit(self._game_over_surf, text_rect)
         
         # Draw restart instruction
-        restart_text = self.font.render("Press R to restart", True, self.COLORS['text'])
-        restart_rect = restart_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 50))
-        self.screen.blit(restart_text, restart_rect)
+        restart_rect = self._restart_surf.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 50))
+        self.screen.blit(self._restart_surf, restart_rect)
     
     def draw_score(self, score: int, lines_cleared: int) -> None:
         """
@@ -165,14 +298,26 @@ class GameDisplay:
             score: Current score
             lines_cleared: Number of lines cleared
         """
-        score_text = self.font.render(f"Score: {score}", True, self.COLORS['text'])
-        lines_text = self.font.render(f"Lines: {lines_cleared}", True, self.COLORS['text'])
+        # Only rasterize the text again when the values change
+        changed = (score, lines_cleared) != self._score_cache[:2]
+        if changed:
+            self._score_cache = (score, lines_cleared, (
+                self.font.render(f"Score: {score}", True, self.COLORS['text']),
+                self.font.render(f"Lines: {lines_cleared}", True, self.COLORS['text'])
+            ))
+        score_text, lines_text = self._score_cache[2]
         
         score_x = self.board_x + 12 * self.block_size
         score_y = self.board_y + 8 * self.block_size
         
-        self.screen.blit(score_text, (score_x, score_y))
-        self.screen.blit(lines_text, (score_x, score_y + 40))
+        score_rects = [self.screen.blit(score_text, (score_x, score_y)),
+                       self.screen.blit(lines_text, (score_x, score_y + 40))]
+        
+        # Repaint the area of both the old and the new text
+        if changed:
+            self._dirty_rects.extend(self._score_rects)
+            self._dirty_rects.extend(score_rects)
+            self._score_rects = score_rects
     
     def clear_screen(self) -> None:
         """
@@ -182,9 +327,24 @@ class GameDisplay:
     
     def update_display(self) -> None:
         """
-        Update the display (flip buffers).
+        Update the display, pushing only the regions that changed since the
+        last update unless a full repaint is needed.
+        """
+        if self._full_update or self._overlay_drawn != self._overlay_shown:
+            pygame.display.flip()
+        elif self._dirty_rects:
+            pygame.display.update(self._dirty_rects)
+        
+        self._dirty_rects = []
+        self._full_update = False
+        self._overlay_shown = self._overlay_drawn
+        self._overlay_drawn = False
+    
+    def invalidate(self) -> None:
+        """
+        Force the next update_display() to repaint the whole window.
         """
-        pygame.display.flip()
+        self._full_update = True
     
     def quit(self) -> None:
         """
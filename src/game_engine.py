@@ -2,11 +2,22 @@
 Game Engine class for managing the main Tetris game logic.
 """
 import random
-from typing import Optional, Dict, Any
-from .tetromino import Tetromino, TETROMINO_SHAPES
+from collections import deque
+from typing import Optional, Dict, Any, Deque, List, NamedTuple
+from .tetromino import Tetromino, SHAPE_NAMES
 from .game_board import GameBoard
 
 
+class InputState(NamedTuple):
+    """
+    Held state of the movement keys for a single frame.
+    """
+    left: bool = False
+    right: bool = False
+    down: bool = False
+    up: bool = False
+
+
 class GameEngine:
     """
     Main game engine that controls the Tetris game logic.
@@ -25,15 +36,16 @@ class GameEngine:
         self.score: int = 0
         self.lines_cleared: int = 0
         
+        # Shuffled bag of upcoming shape types, refilled when empty
+        self._bag: Deque[str] = deque()
+        
+        # Set whenever the visible state changes; cleared by the renderer
+        self.dirty: bool = True
+        
         # Input handling timing
         self.move_delay: float = 0.1  # Delay between horizontal moves (reduced for better responsiveness)
         self.move_time: float = 0.0
-        self.last_keys: Dict[str, bool] = {
-            'left': False,
-            'right': False,
-            'down': False,
-            'up': False
-        }
+        self._last_up: bool = False  # Rotate key state on the previous frame
         
         # Initialize with first pieces
         self.spawn_new_piece()
@@ -57,38 +69,38 @@ class GameEngine:
             self._try_move_current_piece(0, 1)
             self.fall_time = 0.0
     
-    def handle_input(self, keys: Dict[str, bool]) -> None:
+    def handle_input(self, keys: InputState) -> None:
         """
         Handle player input with proper timing controls.
         
         Args:
-            keys: Dictionary of key states
+            keys: Key states for the current frame
         """
         # Disable input when game is over (Requirement 6.3)
         if self.game_over:
             return
         
         # Handle rotation (only on key press, not while held)
-        if keys.get('up', False) and not self.last_keys.get('up', False):
+        if keys.up and not self._last_up:
             self._try_rotate_current_piece()
         
         # Handle horizontal movement with timing
         if self.move_time >= self.move_delay:
-            if keys.get('left', False):
+            if keys.left:
                 self._try_move_current_piece(-1, 0)
                 self.move_time = 0.0
-            elif keys.get('right', False):
+            elif keys.right:
                 self._try_move_current_piece(1, 0)
                 self.move_time = 0.0
         
         # Handle down movement (faster than automatic fall)
-        if keys.get('down', False):
+        if keys.down:
             if self.move_time >= self.move_delay * 0.3:  # Faster down movement
                 self._try_move_current_piece(0, 1)
                 self.move_time = 0.0
         
-        # Store current key states for next frame
-        self.last_keys = keys.copy()
+        # Store rotate key state for next frame
+        self._last_up = keys.up
     
     def spawn_new_piece(self) -> None:
         """
@@ -105,6 +117,7 @@ class GameEngine:
         
         # Generate next piece
         self.next_piece = self._generate_random_piece()
+        self.dirty = True
         
         # Check for game over
         if not self.board.is_valid_position(self.current_piece, 
@@ -123,13 +136,18 @@ class GameEngine:
     
     def _generate_random_piece(self) -> Tetromino:
         """
-        Generate a random tetromino.
+        Generate a random tetromino using the 7-bag randomizer.
+        
+        Every run of seven pieces contains each shape exactly once.
         
         Returns:
             A new random Tetromino instance
         """
-        shape_type = random.choice(list(TETROMINO_SHAPES.keys()))
-        return Tetromino(shape_type)
+        if not self._bag:
+            shape_types = list(SHAPE_NAMES)
+            random.shuffle(shape_types)
+            self._bag.extend(shape_types)
+        return Tetromino(self._bag.popleft())
     
     def _try_move_current_piece(self, dx: int, dy: int) -> bool:
         """
@@ -148,6 +166,7 @@ class GameEngine:
         # Use enhanced collision detection
         if self.board.can_move_piece(self.current_piece, dx, dy):
             self.current_piece.move(dx, dy)
+            self.dirty = True
             return True
         else:
             # If moving down failed, place the piece
@@ -168,6 +187,7 @@ class GameEngine:
         # Use enhanced collision detection
         if self.board.can_rotate_piece(self.current_piece):
             self.current_piece.rotate()
+            self.dirty = True
             return True
         else:
             return False
@@ -196,14 +216,26 @@ class GameEngine:
         """
         Get the current game state.
         
+        Called every rendered frame, so the board is returned by reference
+        for read-only use; use snapshot_board() when a copy is needed.
+        
         Returns:
             Dictionary containing current game state
         """
         return {
-            'board': self.board.get_grid_copy(),
+            'board': self.board,
             'current_piece': self.current_piece,
             'next_piece': self.next_piece,
             'score': self.score,
             'lines_cleared': self.lines_cleared,
             'game_over': self.game_over
-        }
\ No newline at end of file
+        }
+    
+    def snapshot_board(self) -> List[List[int]]:
+        """
+        Get a copy of the current board grid.
+        
+        Returns:
+            List of rows, each a list of cell values (1 = occupied, 0 = empty)
+        """
+        return self.board.get_grid_copy()
@@ -41,12 +41,60 @@ TETROMINO_SHAPES: Dict[str, List[List[str]]] = {
     ]
 }
 
+# Shape types in shape id order, and the reverse mapping
+SHAPE_NAMES: Tuple[str, ...] = tuple(TETROMINO_SHAPES)
+SHAPE_IDS: Dict[str, int] = {shape_type: shape_id for shape_id, shape_type in enumerate(SHAPE_NAMES)}
+
+# Filled (dx, dy) offsets for every rotation of every shape, indexed by shape id,
+# parsed once at import
+SHAPE_OFFSETS: Tuple[Tuple[Tuple[Tuple[int, int], ...], ...], ...] = tuple(
+    tuple(
+        tuple((col_idx, row_idx)
+              for row_idx, row in enumerate(rotation)
+              for col_idx, cell in enumerate(row)
+              if cell != '.' and cell != ' ')
+        for rotation in TETROMINO_SHAPES[shape_type]
+    )
+    for shape_type in SHAPE_NAMES
+)
+
+
+def _build_row_masks(offsets: Tuple[Tuple[int, int], ...]
+                     ) -> Tuple[int, int, int, int, Tuple[int, ...]]:
+    """
+    Pack a rotation's block offsets into per-row bitmasks.
+    
+    Args:
+        offsets: Filled (dx, dy) offsets of one rotation
+        
+    Returns:
+        Tuple of (min_row, max_row, min_col, max_col, row_masks) where
+        row_masks[i] covers row min_row + i with bit 0 at column min_col
+    """
+    min_row = min(dy for _, dy in offsets)
+    max_row = max(dy for _, dy in offsets)
+    min_col = min(dx for dx, _ in offsets)
+    max_col = max(dx for dx, _ in offsets)
+    row_masks = [0] * (max_row - min_row + 1)
+    for dx, dy in offsets:
+        row_masks[dy - min_row] |= 1 << (dx - min_col)
+    return min_row, max_row, min_col, max_col, tuple(row_masks)
+
+
+# Row bitmasks and extents for every rotation of every shape, indexed by shape id
+SHAPE_ROW_MASKS: Tuple[Tuple[Tuple[int, int, int, int, Tuple[int, ...]], ...], ...] = tuple(
+    tuple(_build_row_masks(offsets) for offsets in rotations)
+    for rotations in SHAPE_OFFSETS
+)
+
 
 class Tetromino:
     """
     Represents a Tetromino piece with shape, position, and rotation.
     """
     
+    __slots__ = ('shape_id', 'shape', 'rotation_count', '_rot_mask', 'x', 'y', 'rotation')
+    
     def __init__(self, shape_type: str):
         """
         Initialize a Tetromino with the specified shape type.
@@ -57,18 +105,34 @@ class Tetromino:
         if shape_type not in TETROMINO_SHAPES:
             raise ValueError(f"Invalid shape type: {shape_type}")
             
-        self.shape_type: str = shape_type
+        self.shape_id: int = SHAPE_IDS[shape_type]
         self.shape: List[List[str]] = TETROMINO_SHAPES[shape_type]
+        self.rotation_count: int = len(SHAPE_OFFSETS[self.shape_id])
+        # Every shape has 1, 2 or 4 rotations, so wrapping is a bitwise AND
+        self._rot_mask: int = self.rotation_count - 1
         self.x: int = 0
         self.y: int = 0
         self.rotation: int = 0
     
+    @property
+    def shape_type(self) -> str:
+        """
+        Shape type letter of this tetromino ('I', 'O', 'T', 'S', 'Z', 'J', 'L').
+        """
+        return SHAPE_NAMES[self.shape_id]
+    
+    @property
+    def next_rotation(self) -> int:
+        """
+        Rotation index the tetromino would have after one clockwise rotation.
+        """
+        return (self.rotation + 1) & self._rot_mask
+    
     def rotate(self) -> None:
         """
         Rotate the tetromino clockwise by 90 degrees.
         """
-        max_rotations = len(self.shape)
-        self.rotation = (self.rotation + 1) % max_rotations
+        self.rotation = self.next_rotation
     
     def move(self, dx: int, dy: int) -> None:
         """
@@ -97,12 +161,14 @@ class Tetromino:
         Returns:
             List of (x, y) tuples representing block positions
         """
-        blocks = []
-        current_shape = self.get_rotated_shape()
-        
-        for row_idx, row in enumerate(current_shape):
-            for col_idx, cell in enumerate(row):
-                if cell != '.' and cell != ' ':
-                    blocks.append((self.x + col_idx, self.y + row_idx))
+        x, y = self.x, self.y
+        return [(x + dx, y + dy) for dx, dy in self.get_offsets()]
+    
+    def get_offsets(self) -> Tuple[Tuple[int, int], ...]:
+        """
+        Get the block offsets of the current rotation relative to the piece origin.
         
-        return blocks
\ No newline at end of file
+        Returns:
+            Shared tuple of (dx, dy) tuples
+        """
+        return SHAPE_OFFSETS[self.shape_id][self.rotation]